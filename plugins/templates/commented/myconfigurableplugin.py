@@ -13,12 +13,18 @@ pluginVersion='0.1'
 # (only SPADS versions >= 0.12.29 support Python plugins)
 requiredSpadsVersion='0.12.29'
 
+# This is the message we log when the plugin is loaded (built once for all)
+pluginLoadedMessage='Plugin loaded (version %s)' % pluginVersion
+
 # We define one global setting "MyGlobalSetting" and one preset setting "MyPresetSetting".
 # Both are of type "notNull", which means any non-null value is allowed
 # (check %paramTypes hash in SpadsConf.pm for a complete list of allowed setting types)
 globalPluginParams = { 'MyGlobalSetting': ['notNull'] }
 presetPluginParams = { 'MyPresetSetting': ['notNull'] }
 
+# These are the settings returned to SPADS by getParams (built once for all)
+pluginParams = [ globalPluginParams , presetPluginParams ]
+
 
 # This is how SPADS gets our version number (mandatory callback)
 def getVersion(pluginObject):
@@ -30,7 +36,7 @@ def getRequiredSpadsVersion(pluginName):
 
 # This is how SPADS finds what settings we need in our configuration file (mandatory callback for configurable plugins)
 def getParams(pluginName):
-    return [ globalPluginParams , presetPluginParams ]
+    return pluginParams
 
 
 
@@ -41,4 +47,4 @@ class MyConfigurablePlugin:
     def __init__(self,context):
         
         # We call the API function "slog" to log a notice message (level 3) when the plugin is loaded
-        spads.slog("Plugin loaded (version %s)" % pluginVersion,3)
+        spads.slog(pluginLoadedMessage,3)
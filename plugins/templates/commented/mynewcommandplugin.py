@@ -5,6 +5,21 @@ import perl
 # We will use this object to call the plugin API
 spads=perl.MyNewCommandPlugin
 
+# Strings received from Perl only need to be "fixed" if the Inline::Python
+# module transmits them as byte strings. We check it once for all here, so we
+# don't call the Perl "fix_string" function needlessly for each string received.
+# When strings do need to be fixed, we fix them directly in Python: the byte
+# strings transmitted by Inline::Python contain one byte per character, so
+# decoding them as latin-1 gives the same result as the Perl "fix_string"
+# function, without calling Perl.
+if spads.get_flag('use_byte_string'):
+    def fixString(*strings):
+        fixedStrings=tuple(string.decode('latin-1') if isinstance(string,bytes) else string for string in strings)
+        return fixedStrings[0] if len(fixedStrings) == 1 else fixedStrings
+else:
+    def fixString(*strings):
+        return strings[0] if len(strings) == 1 else strings
+
 
 # This is the first version of the plugin
 pluginVersion='0.1'
@@ -13,6 +28,9 @@ pluginVersion='0.1'
 # (only SPADS versions >= 0.12.29 support Python plugins)
 requiredSpadsVersion='0.12.29'
 
+# This is the message we log when the plugin is loaded (built once for all)
+pluginLoadedMessage='Plugin loaded (version %s)' % pluginVersion
+
 # We define 2 global settings (mandatory for plugins implementing new commands):
 # - commandsFile: name of the plugin commands rights configuration file (located in etc dir, same syntax as commands.conf)
 # - helpFile: name of plugin commands help file (located in plugin dir, same syntax as help.dat)
@@ -20,6 +38,9 @@ globalPluginParams = { 'commandsFile': ['notNull'],
                        'helpFile': ['notNull'] }
 presetPluginParams = None
 
+# These are the settings returned to SPADS by getParams (built once for all)
+pluginParams = [ globalPluginParams , presetPluginParams ]
+
 
 # This is how SPADS gets our version number (mandatory callback)
 def getVersion(pluginObject):
@@ -31,7 +52,7 @@ def getRequiredSpadsVersion(pluginName):
 
 # This is how SPADS finds what settings we need in our configuration file (mandatory callback for configurable plugins)
 def getParams(pluginName):
-    return [ globalPluginParams , presetPluginParams ]
+    return pluginParams
 
 
 
@@ -42,10 +63,10 @@ class MyNewCommandPlugin:
     def __init__(self,context):
         
         # We declare our new command and the associated handler
-        spads.addSpadsCommandHandler({'myCommand': hMyCommand})
+        spads.addSpadsCommandHandler({'myCommand': self.hMyCommand})
         
         # We call the API function "slog" to log a notice message (level 3) when the plugin is loaded
-        spads.slog("Plugin loaded (version %s)" % pluginVersion,3)
+        spads.slog(pluginLoadedMessage,3)
 
         
     # This is the callback called when the plugin is unloaded
@@ -58,25 +79,23 @@ class MyNewCommandPlugin:
         spads.slog("Plugin unloaded",3)
 
 
+    # This is the handler for our new command
+    def hMyCommand(self,source,user,params,checkOnly):
 
-# This is the handler for our new command
-def hMyCommand(source,user,params,checkOnly):
-
-    # checkOnly is true if this is just a check for callVote command, not a real command execution
-    if checkOnly :
+        # checkOnly is true if this is just a check for callVote command, not a real command execution
+        if checkOnly :
         
-        # MyCommand is a basic command, we have nothing to check in case of callvote
-        return 1
+            # MyCommand is a basic command, we have nothing to check in case of callvote
+            return 1
     
-    # Fix strings received from Perl if needed
-    # This is in case Inline::Python handles Perl strings as byte strings instead of normal strings
-    # (this step can be skipped if your Inline::Python version isn't afffected by this bug)
-    user=spads.fix_string(user)
-    for i in range(len(params)):
-        params[i]=spads.fix_string(params[i])
+        # Fix strings received from Perl if needed
+        # This is in case Inline::Python handles Perl strings as byte strings instead of normal strings
+        # (fixString does nothing if your Inline::Python version isn't afffected by this bug)
+        user=fixString(user)
+        params=[fixString(param) for param in params]
         
-    # We join the parameters provided (if any), using ',' as delimiter
-    paramsString = ','.join(params)
+        # We join the parameters provided (if any), using ',' as delimiter
+        paramsString = ','.join(params)
 
-    # We log the command call as notice message
-    spads.slog("User %s called command myCommand with parameter(s) \"%s\"" % (user,paramsString),3)
+        # We log the command call as notice message
+        spads.slog("User %s called command myCommand with parameter(s) \"%s\"" % (user,paramsString),3)
@@ -13,6 +13,9 @@ pluginVersion='0.1'
 # (only SPADS versions >= 0.12.29 support Python plugins)
 requiredSpadsVersion='0.12.29'
 
+# This is the message we log when the plugin is loaded (built once for all)
+pluginLoadedMessage='Plugin loaded (version %s)' % pluginVersion
+
 
 # This is how SPADS gets our version number (mandatory callback)
 def getVersion(pluginObject):
@@ -31,4 +34,4 @@ class MySimplePlugin:
     def __init__(self,context):
         
         # We call the API function "slog" to log a notice message (level 3) when the plugin is loaded
-        spads.slog("Plugin loaded (version %s)" % pluginVersion,3)
+        spads.slog(pluginLoadedMessage,3)
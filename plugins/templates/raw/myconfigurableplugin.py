@@ -4,9 +4,11 @@ spads=perl.MyConfigurablePlugin
 
 pluginVersion='0.1'
 requiredSpadsVersion='0.12.29'
+pluginLoadedMessage='Plugin loaded (version %s)' % pluginVersion
 
 globalPluginParams = { 'MyGlobalSetting': ['notNull'] }
 presetPluginParams = { 'MyPresetSetting': ['notNull'] }
+pluginParams = [ globalPluginParams , presetPluginParams ]
 
 
 def getVersion(pluginObject):
@@ -16,10 +18,10 @@ def getRequiredSpadsVersion(pluginName):
     return requiredSpadsVersion
 
 def getParams(pluginName):
-      return [ globalPluginParams , presetPluginParams ]
+      return pluginParams
 
   
 class MyConfigurablePlugin:
 
     def __init__(self,context):
-        spads.slog("Plugin loaded (version %s)" % pluginVersion,3)
+        spads.slog(pluginLoadedMessage,3)
@@ -1,13 +1,23 @@
 import perl
 spads=perl.MyNewCommandPlugin
 
+if spads.get_flag('use_byte_string'):
+    def fixString(*strings):
+        fixedStrings=tuple(string.decode('latin-1') if isinstance(string,bytes) else string for string in strings)
+        return fixedStrings[0] if len(fixedStrings) == 1 else fixedStrings
+else:
+    def fixString(*strings):
+        return strings[0] if len(strings) == 1 else strings
+
 
 pluginVersion='0.1'
 requiredSpadsVersion='0.12.29'
+pluginLoadedMessage='Plugin loaded (version %s)' % pluginVersion
 
 globalPluginParams = { 'commandsFile': ['notNull'],
                        'helpFile': ['notNull'] }
 presetPluginParams = None
+pluginParams = [ globalPluginParams , presetPluginParams ]
 
 
 def getVersion(pluginObject):
@@ -17,25 +27,23 @@ def getRequiredSpadsVersion(pluginName):
     return requiredSpadsVersion
 
 def getParams(pluginName):
-    return [ globalPluginParams , presetPluginParams ]
+    return pluginParams
 
 
 class MyNewCommandPlugin:
 
     def __init__(self,context):
-        spads.addSpadsCommandHandler({'myCommand': hMyCommand})
-        spads.slog("Plugin loaded (version %s)" % pluginVersion,3)
+        spads.addSpadsCommandHandler({'myCommand': self.hMyCommand})
+        spads.slog(pluginLoadedMessage,3)
 
     def onUnload(self,reason):
         spads.removeSpadsCommandHandler(['myCommand'])
         spads.slog("Plugin unloaded",3)
 
-
-def hMyCommand(source,user,params,checkOnly):
-    if checkOnly :
-        return 1
-    user=spads.fix_string(user)
-    for i in range(len(params)):
-        params[i]=spads.fix_string(params[i])
-    paramsString = ','.join(params)
-    spads.slog("User %s called command myCommand with parameter(s) \"%s\"" % (user,paramsString),3)
+    def hMyCommand(self,source,user,params,checkOnly):
+        if checkOnly :
+            return 1
+        user=fixString(user)
+        params=[fixString(param) for param in params]
+        paramsString = ','.join(params)
+        spads.slog("User %s called command myCommand with parameter(s) \"%s\"" % (user,paramsString),3)
@@ -4,6 +4,7 @@ spads=perl.MySimplePlugin
 
 pluginVersion='0.1'
 requiredSpadsVersion='0.12.29'
+pluginLoadedMessage='Plugin loaded (version %s)' % pluginVersion
 
 
 def getVersion(pluginObject):
@@ -16,4 +17,4 @@ def getRequiredSpadsVersion(pluginName):
 class MySimplePlugin:
 
     def __init__(self,context):
-        spads.slog("Plugin loaded (version %s)" % pluginVersion,3)
+        spads.slog(pluginLoadedMessage,3)
@@ -8,6 +8,28 @@ import re
 # We will use this object to call the plugin API
 spads=perl.ForbiddenWords
 
+# Strings received from Perl only need to be "fixed" if the Inline::Python
+# module transmits them as byte strings. We check it once for all here, so we
+# don't call the Perl "fix_string" function needlessly for each string received.
+# When strings do need to be fixed, we fix them directly in Python: the byte
+# strings transmitted by Inline::Python contain one byte per character, so
+# decoding them as latin-1 gives the same result as the Perl "fix_string"
+# function, without calling Perl.
+if spads.get_flag('use_byte_string'):
+    def fixString(*strings):
+        fixedStrings=tuple(string.decode('latin-1') if isinstance(string,bytes) else string for string in strings)
+        return fixedStrings[0] if len(fixedStrings) == 1 else fixedStrings
+else:
+    def fixString(*strings):
+        return strings[0] if len(strings) == 1 else strings
+
+# These are the plugin API functions called each time our handler is called.
+# We store them in module variables once for all, so we don't have to look
+# them up through the "spads" Perl object at each call.
+spadsGetUserAccessLevel=spads.getUserAccessLevel
+spadsSayBattle=spads.sayBattle
+spadsQueueLobbyCommand=spads.queueLobbyCommand
+
 # This is the first version of the plugin
 pluginVersion='0.1'
 
@@ -15,6 +37,9 @@ pluginVersion='0.1'
 # (only SPADS versions >= 0.12.29 support Python plugins)
 requiredSpadsVersion='0.12.29'
 
+# This is the message we log when the plugin is loaded (built once for all)
+pluginLoadedMessage='Plugin loaded (version %s)' % pluginVersion
+
 # We define one global setting "words" and one preset setting "immuneLevel".
 # "words" has no type associated (no restriction on allowed values)
 # "immuneLevel" must be an integer or an integer range
@@ -23,6 +48,9 @@ requiredSpadsVersion='0.12.29'
 globalPluginParams = { 'words': [] }
 presetPluginParams = { 'immuneLevel': ['integer','integerRange'] }
 
+# These are the settings returned to SPADS by getParams (built once for all)
+pluginParams = [ globalPluginParams , presetPluginParams ]
+
 
 # This is how SPADS gets our version number (mandatory callback)
 def getVersion(pluginObject):
@@ -34,7 +62,7 @@ def getRequiredSpadsVersion(pluginName):
 
 # This is how SPADS finds what settings we need in our configuration file (mandatory callback for configurable plugins)
 def getParams(pluginName):
-    return [ globalPluginParams , presetPluginParams ]
+    return pluginParams
 
 
 
@@ -45,19 +73,48 @@ class ForbiddenWords:
     def __init__(self,context):
         
         # We call the API function "slog" to log a notice message (level 3) when the plugin is loaded
-        spads.slog("Plugin loaded (version %s)" % pluginVersion,3)
+        spads.slog(pluginLoadedMessage,3)
+
+        # We retrieve the settings needed by our SAIDBATTLE handler
+        self.wordsConf = None
+        self.refreshSettings()
 
         # We set up a lobby command handler on SAIDBATTLE
-        spads.addLobbyCommandHandler({'SAIDBATTLE': hLobbySaidBattle})
+        # (the handlers dictionary is built once for all, as we need it again
+        # each time we reconnect to the lobby server)
+        self.lobbyCommandHandlers = {'SAIDBATTLE': self.hLobbySaidBattle}
+        spads.addLobbyCommandHandler(self.lobbyCommandHandlers)
 
 
     # This callback is called each time we (re)connect to the lobby server
     def onLobbyConnected(self,lobbyInterface):
         
+        # We retrieve the settings needed by our SAIDBATTLE handler again,
+        # in case they changed while we were disconnected
+        self.refreshSettings()
+        
         # When we are disconnected from the lobby server, all lobby command
         # handlers are automatically removed, so we (re)set up our command
         # handler here.
-        spads.addLobbyCommandHandler({'SAIDBATTLE': hLobbySaidBattle})
+        spads.addLobbyCommandHandler(self.lobbyCommandHandlers)
+
+
+    # This callback is called each time a global preset is applied
+    # ("immuneLevel" is a preset setting, so it may have changed)
+    def onPresetApplied(self,oldPresetName,newPresetName):
+        self.refreshSettings()
+
+
+    # This callback is called each time the SPADS configuration is reloaded
+    def onReloadConf(self,keepSettings):
+        self.refreshSettings()
+        return 1
+
+
+    # This callback is called each time a setting of the plugin configuration
+    # is changed (using "!plugin ForbiddenWords set ..." command)
+    def onSettingChange(self,settingName,oldValue,newValue):
+        self.refreshSettings()
 
 
     # This callback is called when the plugin is unloaded
@@ -66,41 +123,92 @@ class ForbiddenWords:
         # We remove our lobby command handler when the plugin is unloaded
         spads.removeLobbyCommandHandler(['SAIDBATTLE'])
 
+        # We drop our lobby command handlers dictionary, which references our
+        # bound handler method (and so the plugin object itself)
+        self.lobbyCommandHandlers = None
+
 
-# This is the handler we set up on SAIDBATTLE lobby command.
-# It is called each time a player says something in the battle lobby.
-#   command is the lobby command name (SAIDBATTLE)
-#   user is the name of the user who said something in the battle lobby
-#   message is the message said in the battle lobby
-def hLobbySaidBattle(command,user,message):
+    # This method retrieves the settings needed by our SAIDBATTLE handler
+    # from the SPADS configuration and the plugin configuration, and prepares
+    # the forbidden words data (so we don't have to do it each time someone
+    # says something in the battle lobby).
+    # It must be called each time these configurations may have changed.
+    def refreshSettings(self):
+        
+        spadsConf = spads.getSpadsConf()
+        pluginConf = spads.getPluginConf()
+        (self.lobbyLogin,immuneLevel,wordsConf)=fixString(spadsConf['lobbyLogin'],pluginConf['immuneLevel'],pluginConf['words'])
+        
+        # We convert the immune level to integer once for all
+        self.immuneLevel = int(immuneLevel)
+        
+        # We prepare the forbidden words in lowercase, and the compiled regular
+        # expressions matching all the forbidden words (only if the "words"
+        # setting value changed since last time). These data are stored in the
+        # plugin object only, so the previous ones can be freed.
+        if wordsConf != self.wordsConf:
+            (self.lcForbiddenWords,self.asciiWords,self.minWordLength,self.wordsRegex) = getForbiddenWords(wordsConf)
+            self.wordsConf = wordsConf
+
+
+    # This is the handler we set up on SAIDBATTLE lobby command.
+    # It is called each time a player says something in the battle lobby.
+    #   command is the lobby command name (SAIDBATTLE)
+    #   user is the name of the user who said something in the battle lobby
+    #   message is the message said in the battle lobby
+    def hLobbySaidBattle(self,command,user,message):
     
-    # First we "fix" strings received from Perl in case
-    # the Inline::Python module transmits them as byte strings
-    (user,message)=spads.fix_string(user,message)
+        # First we "fix" strings received from Perl in case
+        # the Inline::Python module transmits them as byte strings
+        (user,message)=fixString(user,message)
     
-    # Here we check it's not a message from SPADS (so we don't kick ourself)
-    spadsConf = spads.getSpadsConf()
-    if user == spadsConf['lobbyLogin']:
-        return
+        # Messages shorter than the shortest forbidden word (such as "gg")
+        # cannot contain any forbidden word, so we ignore them right away
+        if len(message) < self.minWordLength:
+            return
     
-    # Then we check the user isn't a privileged user
-    # (autohost access level >= immuneLevel)
-    pluginConf = spads.getPluginConf()
-    if int(spads.getUserAccessLevel(user)) >= int(pluginConf['immuneLevel']):
-        return
+        # Here we check it's not a message from SPADS (so we don't kick ourself)
+        if user == self.lobbyLogin:
+            return
     
-    # We put the forbidden words in a list
-    forbiddenWords = pluginConf['words'].split(';')
-            
-    # We test each forbidden word
-    for forbiddenWord in forbiddenWords:
-        
-        # If the message contains the forbidden word (case insensitive)
-        if re.search(r'\b' + re.escape(forbiddenWord) + r'\b',message,re.IGNORECASE):
-            
-            # Then we kick the user from the battle lobby
-            spads.sayBattle("Kicking %s from battle (watch your language!)" % user)
-            spads.queueLobbyCommand(["KICKFROMBATTLE",user])
-                    
-            # We quit the foreach loop (no need to test other forbidden word)
-            break
+        # Most messages don't contain any forbidden word at all, so we first
+        # perform a quick substring check before using the regular expression.
+        # This check is only reliable when both the message and the forbidden
+        # words are ASCII (case insensitive matching of some non-ASCII letters
+        # such as "İ" cannot be checked using lowercase substrings).
+        if self.asciiWords and message.isascii():
+            lcMessage = message.lower()
+            if not any(lcForbiddenWord in lcMessage for lcForbiddenWord in self.lcForbiddenWords):
+                return
+    
+        # If the message doesn't contain any forbidden word (whole word, case
+        # insensitive), we have nothing to do
+        if not self.wordsRegex.search(message):
+            return
+    
+        # Then we check the user isn't a privileged user
+        # (autohost access level >= immuneLevel)
+        if int(spadsGetUserAccessLevel(user)) >= self.immuneLevel:
+            return
+    
+        # Then we kick the user from the battle lobby
+        # (Python tuples are transmitted to Perl as array references, like lists)
+        spadsSayBattle("Kicking %s from battle (watch your language!)" % user)
+        spadsQueueLobbyCommand(("KICKFROMBATTLE",user))
+
+
+# This function returns the forbidden words listed in the "words" setting value
+# given as parameter, as a tuple of lowercase words, a boolean indicating if all
+# the words are ASCII, the length of the shortest word, and a compiled regular
+# expression matching any of them.
+def getForbiddenWords(wordsConf):
+    
+    # We put the forbidden words in a list, and we build one single
+    # case insensitive regular expression matching any of them
+    forbiddenWords = wordsConf.split(';')
+    lcForbiddenWords = tuple(forbiddenWord.lower() for forbiddenWord in forbiddenWords)
+    asciiWords = hasattr(wordsConf,'isascii') and wordsConf.isascii()
+    minWordLength = min(len(forbiddenWord) for forbiddenWord in forbiddenWords)
+    wordsRegex = re.compile(r'\b(?:' + '|'.join(map(re.escape,forbiddenWords)) + r')\b',re.IGNORECASE)
+    
+    return (lcForbiddenWords,asciiWords,minWordLength,wordsRegex)
@@ -5,6 +5,21 @@ import perl
 # We will use this object to call the plugin API
 spads=perl.HelloWorld
 
+# Strings received from Perl only need to be "fixed" if the Inline::Python
+# module transmits them as byte strings. We check it once for all here, so we
+# don't call the Perl "fix_string" function needlessly for each string received.
+# When strings do need to be fixed, we fix them directly in Python: the byte
+# strings transmitted by Inline::Python contain one byte per character, so
+# decoding them as latin-1 gives the same result as the Perl "fix_string"
+# function, without calling Perl.
+if spads.get_flag('use_byte_string'):
+    def fixString(*strings):
+        fixedStrings=tuple(string.decode('latin-1') if isinstance(string,bytes) else string for string in strings)
+        return fixedStrings[0] if len(fixedStrings) == 1 else fixedStrings
+else:
+    def fixString(*strings):
+        return strings[0] if len(strings) == 1 else strings
+
 
 # This is the first version of the plugin
 pluginVersion='0.1'
@@ -13,6 +28,9 @@ pluginVersion='0.1'
 # (only SPADS versions >= 0.12.29 support Python plugins)
 requiredSpadsVersion='0.12.29'
 
+# This is the message we log when the plugin is loaded (built once for all)
+pluginLoadedMessage='Plugin loaded (version %s)' % pluginVersion
+
 
 # This is how SPADS gets our version number (mandatory callback)
 def getVersion(pluginObject):
@@ -31,7 +49,7 @@ class HelloWorld:
     def __init__(self,context):
         
         # We call the API function "slog" to log a notice message (level 3) when the plugin is loaded
-        spads.slog("Plugin loaded (version %s)" % pluginVersion,3)
+        spads.slog(pluginLoadedMessage,3)
 
     # This is the callback called each time SPADS receives a private message
     #   self is the plugin object (first parameter of all plugin callbacks)
@@ -41,7 +59,7 @@ class HelloWorld:
     
         # Here we "fix" strings received from Perl in case
         # the Inline::Python module transmits them as byte strings
-        (userName,message)=spads.fix_string(userName,message)
+        (userName,message)=fixString(userName,message)
    
         # We check the message sent by the user is "Hello"
         if message == 'Hello':
@@ -1,8 +1,8 @@
 # Import the perl module so we can call the SPADS Plugin API
 import perl
 
-# Import the datetime module so we can get current time for our !time command
-import datetime
+# Import the time module so we can get current time for our !time command
+import time
 
 # perl.TimePlugin is the Perl representation of the TimePlugin plugin module
 # We will use this object to call the plugin API
@@ -15,6 +15,9 @@ pluginVersion='0.1'
 # (only SPADS versions >= 0.12.29 support Python plugins)
 requiredSpadsVersion='0.12.29'
 
+# This is the message we log when the plugin is loaded (built once for all)
+pluginLoadedMessage='Plugin loaded (version %s)' % pluginVersion
+
 # We define 2 global settings (mandatory for plugins implementing new commands):
 # - commandsFile: name of the plugin commands rights configuration file (located in etc dir, same syntax as commands.conf)
 # - helpFile: name of plugin commands help file (located in plugin dir, same syntax as help.dat)
@@ -22,6 +25,9 @@ globalPluginParams = { 'commandsFile': ['notNull'],
                        'helpFile': ['notNull'] }
 presetPluginParams = None
 
+# These are the settings returned to SPADS by getParams (built once for all)
+pluginParams = [ globalPluginParams , presetPluginParams ]
+
 
 # This is how SPADS gets our version number (mandatory callback)
 def getVersion(pluginObject):
@@ -33,7 +39,7 @@ def getRequiredSpadsVersion(pluginName):
 
 # This is how SPADS finds what settings we need in our configuration file (mandatory callback for configurable plugins)
 def getParams(pluginName):
-    return [ globalPluginParams , presetPluginParams ]
+    return pluginParams
 
 
 
@@ -44,10 +50,10 @@ class TimePlugin:
     def __init__(self,context):
         
         # We declare our new command and the associated handler
-        spads.addSpadsCommandHandler({'time': hSpadsTime})
+        spads.addSpadsCommandHandler({'time': self.hSpadsTime})
         
         # We call the API function "slog" to log a notice message (level 3) when the plugin is loaded
-        spads.slog("Plugin loaded (version %s)" % pluginVersion,3)
+        spads.slog(pluginLoadedMessage,3)
 
         
     # This is the callback called when the plugin is unloaded
@@ -60,20 +66,20 @@ class TimePlugin:
         spads.slog("Plugin unloaded",3)
 
 
+    # This is the handler for our new command
+    def hSpadsTime(self,source,user,params,checkOnly):
 
-# This is the handler for our new command
-def hSpadsTime(source,user,params,checkOnly):
-
-    # checkOnly is true if this is just a check for callVote command, not a real command execution
-    if checkOnly :
+        # checkOnly is true if this is just a check for callVote command, not a real command execution
+        if checkOnly :
         
-        # time is a basic command, we have nothing to check in case of callvote
-        return 1
+            # time is a basic command, we have nothing to check in case of callvote
+            return 1
 
-    # We get current time using "now" function of datetime class from datetime module
-    current_time = datetime.datetime.now()
-    current_time_string = current_time.strftime("%H:%M:%S")
+        # We get current local time using "localtime" function from time module,
+        # and we format it directly (no need to create a datetime object)
+        current_time = time.localtime()
+        current_time_string = "%02d:%02d:%02d" % (current_time.tm_hour,current_time.tm_min,current_time.tm_sec)
 
-    # We call the API function "answer" to send back the response to the user who called the command
-    # using same canal as he used (private message, battle lobby, in game message...)
-    spads.answer("Current local time: %s" % current_time_string)
+        # We call the API function "answer" to send back the response to the user who called the command
+        # using same canal as he used (private message, battle lobby, in game message...)
+        spads.answer("Current local time: %s" % current_time_string)